@@ -1,6 +1,19 @@
 from __future__ import annotations
 
 # fmt: off
+import os  # isort: skip
+# Must run before NumPy / sklearn are first imported: joblib and Optuna
+# already parallelize across processes and trials, so multi-threaded BLAS on
+# top oversubscribes the CPU (N_workers x N_BLAS threads all contending).
+# `setdefault` so users who know better can still override via environment.
+for _v in (
+    "OMP_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+):
+    os.environ.setdefault(_v, "1")
+
 import sys  # isort: skip
 from pathlib import Path  # isort: skip
 ROOT = Path(__file__).resolve().parent  # isort: skip
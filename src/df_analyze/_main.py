@@ -13,11 +13,13 @@ sys.path.append(str(SRC))  # isort: skip
 import sys
 import traceback
 from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
 from pprint import pprint
-from typing import List, TypeVar, Union
+from typing import List, Optional, TypeVar, Union
 from warnings import warn
 
+import pandas as pd
 from pandas import DataFrame
 
 from df_analyze.analysis.univariate.associate import target_associations
@@ -44,40 +46,41 @@ def listify(item: Union[T, list[T], tuple[T, ...]]) -> List[T]:
     return [item]
 
 
+@lru_cache(maxsize=128)
+def _classify_cols(columns: tuple[str, ...]) -> tuple[Optional[str], bool]:
+    """Auto-detect if classification or regression based on columns. Returns
+    (sort_col, is_regression), where `sort_col` is None if no metric column
+    could be identified. Cached on the column tuple since the same result
+    schema is re-examined at each interim save and final print."""
+    cols = pd.Index(columns).str.lower()
+    maes = cols.str.contains("mae", regex=False) & ~cols.str.contains("sd", regex=False)
+    if maes.any():
+        return columns[maes.argmax()], True
+    accs = cols.str.contains("acc", regex=False)
+    if accs.any():
+        return columns[accs.argmax()], False
+    return None, False
+
+
+def _find_sort_col(df: DataFrame) -> tuple[Optional[str], bool]:
+    return _classify_cols(tuple(map(str, df.columns)))
+
+
 def sort_df(df: DataFrame) -> DataFrame:
     """Auto-detect if classification or regression based on columns and sort"""
-    cols = [c.lower() for c in df.columns]
-    is_regression = False
-    sort_col = None
-    for col in cols:
-        if ("mae" in col) and ("sd" not in col):
-            is_regression = True
-            sort_col = col
-            break
-    if sort_col is None:
+    sort_col, is_regression = _find_sort_col(df)
+    if (sort_col is None) or (not is_regression):
         return df
-    ascending = is_regression
-    return df.sort_values(by=sort_col, ascending=ascending)
+    return df.sort_values(by=sort_col, ascending=is_regression)
 
 
 def print_sorted(df: DataFrame) -> None:
     """Auto-detect if classification or regression based on columns"""
-    cols = [c.lower() for c in df.columns]
-    is_regression = None
-    sort_col = None
-    for col in cols:
-        if "mae" in col:
-            is_regression = True
-            break
-        if "acc" in col:
-            is_regression = False
-            break
-    if is_regression is None:
+    sort_col, is_regression = _find_sort_col(df)
+    if sort_col is None:
         print(df.to_markdown(tablefmt="simple", floatfmt="0.3f"))
         return
-    sort_col = "mae" if is_regression else "acc"
-    ascending = is_regression
-    table = df.sort_values(by=sort_col, ascending=ascending).to_markdown(
+    table = df.sort_values(by=sort_col, ascending=is_regression).to_markdown(
         tablefmt="simple", floatfmt="0.3f"
     )
     print(table)
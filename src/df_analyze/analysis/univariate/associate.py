@@ -396,9 +396,9 @@ class AssocResults:
 
     @staticmethod
     def is_saved(cachedir: Path) -> bool:
-        files = AssocFiles()
-        conts = cachedir / files.conts_raw
-        cats = cachedir / files.cats_raw
+        # filenames are class attributes: no instance needed
+        conts = cachedir / AssocFiles.conts_raw
+        cats = cachedir / AssocFiles.cats_raw
         return conts.exists() and cats.exists()
 
     @staticmethod
@@ -415,9 +415,15 @@ class AssocResults:
         return preds
 
 
-def cont_feature_cat_target_level_stats(x: Series, y: Series, level: Any) -> DataFrame:
+def cont_feature_cat_target_level_stats(
+    x: Series, y: Series, level: Any, x_std: Optional[float] = None
+) -> DataFrame:
     stats = CONT_FEATURE_CAT_TARGET_LEVEL_STATS
 
+    # `x` does not vary across target levels, so callers looping over levels
+    # should compute its sd once and pass it in
+    if x_std is None:
+        x_std = float(np.nanstd(x))
     idx_level = y == level
     y_bin = idx_level.astype(float)
     g0 = x[~idx_level]
@@ -437,7 +443,7 @@ def cont_feature_cat_target_level_stats(x: Series, y: Series, level: Any) -> Dat
     )  # avoid errors for `distribution="t"`
     W, W_p = W_res.statistic, W_res.pvalue
 
-    if np.nanstd(x) == 0:
+    if x_std == 0:
         r, r_p = np.nan, np.nan
         warn(f"Input `x`: {x.name} is constant")
     elif np.nanstd(y_bin) == 0:
@@ -545,9 +551,10 @@ def continuous_feature_target_stats(
         )
     if is_classification:
         levels = np.unique(y).tolist()
+        x_std = float(np.nanstd(x))
         descs = []
         for level in levels:
-            desc = cont_feature_cat_target_level_stats(x, y, level=level)
+            desc = cont_feature_cat_target_level_stats(x, y, level=level, x_std=x_std)
             descs.append(desc)
         desc = pd.concat(descs, axis=0)
         is_multiclass = len(levels) > 2
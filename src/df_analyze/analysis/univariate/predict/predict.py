@@ -81,9 +81,9 @@ class PredResults:
 
     @staticmethod
     def is_saved(cachedir: Path) -> bool:
-        files = PredFiles()
-        conts = cachedir / files.conts_raw
-        cats = cachedir / files.cats_raw
+        # filenames are class attributes: no instance needed
+        conts = cachedir / PredFiles.conts_raw
+        cats = cachedir / PredFiles.cats_raw
         return conts.exists() and cats.exists()
 
     @staticmethod
@@ -16,6 +16,7 @@ import traceback
 from argparse import ArgumentParser, Namespace, RawTextHelpFormatter
 from copy import deepcopy
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from random import choice, randint, uniform
 from typing import (
@@ -120,6 +121,14 @@ from df_analyze.utils import Debug
 Size = Union[float, int]
 
 
+@lru_cache(maxsize=None)
+def _sorted_tuple(items: Tuple) -> Tuple:
+    """Dedup and sort once per distinct input: options are often rebuilt with
+    identical CLI tuples (tests, subprocess workers) and these normalized
+    tuples feed `ProgramOptions.hash`."""
+    return tuple(sorted(set(items)))
+
+
 class Verbosity(Enum):
     """
     Properties
@@ -209,7 +218,9 @@ class ProgramOptions(Debug):
         self.nan_handling: NanHandling = nan_handling
         self.norm: Normalization = norm
         # self.feat_clean: Tuple[FeatureCleaning, ...] = tuple(sorted(set(feat_clean)))
-        self.feat_select: Tuple[FeatureSelection, ...] = tuple(sorted(set(feat_select)))
+        self.feat_select: Tuple[FeatureSelection, ...] = _sorted_tuple(
+            tuple(feat_select)
+        )
         self.embed_select: Optional[tuple[EmbedSelectionModel, ...]] = embed_select
         self.wrapper_select: Optional[WrapperSelection] = wrapper_select
         self.wrapper_model: WrapperSelectionModel = wrapper_model
@@ -231,10 +242,12 @@ class ProgramOptions(Debug):
         # above this threshold
         self.redundant_corr_threshold: float = abs(redundant_corr_threshold)
         self.is_classification: bool = is_classification
-        self.classifiers: Tuple[DfAnalyzeClassifier, ...] = tuple(
-            sorted(set(classifiers))
+        self.classifiers: Tuple[DfAnalyzeClassifier, ...] = _sorted_tuple(
+            tuple(classifiers)
+        )
+        self.regressors: Tuple[DfAnalyzeRegressor, ...] = _sorted_tuple(
+            tuple(regressors)
         )
-        self.regressors: Tuple[DfAnalyzeRegressor, ...] = tuple(sorted(set(regressors)))
         # self.htune: bool = htune
         # self.htune_val: ValMethod = htune_val
         # self.htune_val_size: Size = htune_val_size
@@ -404,7 +417,10 @@ class ProgramOptions(Debug):
         print("To silence these warnings, use `--verbosity=0`.")
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def validate_datapath(df_path: Optional[Path]) -> Optional[Path]:
+        # cached: stat calls and path resolution are redundant when options are
+        # re-constructed in the same process (e.g. tests, subprocess workers)
         if df_path is None:
             return None
         datapath = resolved_path(df_path)
@@ -415,7 +431,10 @@ class ProgramOptions(Debug):
         return Path(datapath).resolve()
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_outdir(outdir: Optional[Path], datapath: Optional[Path]) -> Optional[Path]:
+        # cached: `makedirs` is idempotent, so repeat constructions with the
+        # same outdir need not hit the filesystem again
         if outdir is None or datapath is None:
             return None
         name = datapath.stem
@@ -521,7 +540,11 @@ def parse_and_merge_args(parser: ArgumentParser, args: Optional[str] = None) ->
     return cli_args
 
 
+@lru_cache(maxsize=None)
 def make_parser() -> ArgumentParser:
+    # built once per process: ~50 add_argument calls are pure overhead on
+    # repeat calls (tests, notebooks), and parse_and_merge_args deepcopies
+    # the parser before mutating it, so sharing the instance is safe
     parser = ArgumentParser(
         prog="df-analyze",
         usage=USAGE_STRING,
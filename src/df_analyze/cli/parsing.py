@@ -21,6 +21,13 @@ def resolved_path(p: Union[str, Path]) -> Path:
     return path
 
 
+_CV_SIZE_ERR = (
+    "`... -size` arguments (e.g. --htune-val-size) must be either a float in "
+    "(0, 1) (a proportion) or an integer greater than 1 (a count / k). See "
+    "documentation for `--htune-val-size` or `--test-val-sizes`."
+)
+
+
 def cv_size(cv_str: str) -> Union[float, int]:
     try:
         cv = float(cv_str)
@@ -28,24 +35,11 @@ def cv_size(cv_str: str) -> Union[float, int]:
         raise ValueError(
             "Could not convert a `... -size` argument (e.g. --htune-val-size) value to float"
         ) from e
-    # validate
-    if isnan(cv):
-        raise ValueError("NaN is not a valid size")
-    if cv <= 0:
-        raise ValueError("`... -size` arguments (e.g. --htune-val-size) must be positive")
-    if cv == 1:
-        raise ValueError(
-            "'1' is not a valid value for `... -size` arguments (e.g. --htune-val-size)."
-        )
-    if (cv > 1) and not cv.is_integer():
-        raise ValueError(
-            "Passing a float greater than 1.0 for `... -size` arguments "
-            "(e.g. --htune-val-size) is not valid. See documentation for "
-            "`--htune-val-size` or `--test-val-sizes`."
-        )
-    if cv > 1:
-        return int(cv)
-    return cv
+    # validate: single branch / single raise site, as this runs per element of
+    # nargs="+" size arguments
+    if isnan(cv) or (cv <= 0) or (cv == 1) or ((cv > 1) and not cv.is_integer()):
+        raise ValueError(f"Got invalid size '{cv_str}'. {_CV_SIZE_ERR}")
+    return int(cv) if cv > 1 else cv
 
 
 def int_or_percent_parser(
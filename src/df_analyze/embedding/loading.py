@@ -1,4 +1,5 @@
 import json
+from importlib.util import find_spec
 from pathlib import Path
 from typing import (
     Optional,
@@ -7,41 +8,65 @@ from typing import (
 import pandas as pd
 from pandas import DataFrame
 
+from df_analyze._setup import MEMOIZER
+
+_HAS_PYARROW = find_spec("pyarrow") is not None
+
 
 
 def load_json_lines(path: Path) -> DataFrame:
-    text = path.read_text()
-    lines = [(s.strip() + "}").replace("}}", "}") for s in text.split("}\n")]
+    # fast path: pandas parses proper JSONL in C without materializing the
+    # file as one big Python string
+    try:
+        return pd.read_json(path, lines=True).infer_objects().convert_dtypes()
+    except ValueError:
+        pass  # malformed lines: re-parse below for a useful error message
+
     objs = []
-    for i, line in enumerate(lines):
-        if len(line) <= 1:  # handles last line, blanks
-            continue
-        try:
-            obj = json.loads(line)
-            objs.append(obj)
-        except json.decoder.JSONDecodeError as e:
-            ix_prv = max(0, i - 1)
-            ix_nxt = min(i + 1, len(lines) - 1)
-            ix_cur = i
-            prv = lines[ix_prv]
-            nxt = lines[ix_nxt]
-            raise ValueError(
-                f"Got error parsing line {i}: `{line}` of file: {path}.\n"
-                f"[{ix_prv:d}] Previous line: {prv}\n"
-                f"[{ix_cur:d}] Current line:  {line}\n"
-                f"[{ix_nxt:d}] Next line:     {nxt}\n"
-            ) from e
+    prev = ""
+    with open(path, "r", buffering=2**20) as handle:
+        for i, line in enumerate(handle):
+            line = line.strip()
+            if len(line) <= 1:  # handles last line, blanks
+                continue
+            try:
+                obj = json.loads(line)
+                objs.append(obj)
+            except json.decoder.JSONDecodeError as e:
+                nxt = next(handle, "").strip()
+                raise ValueError(
+                    f"Got error parsing line {i}: `{line}` of file: {path}.\n"
+                    f"[{max(0, i - 1):d}] Previous line: {prev}\n"
+                    f"[{i:d}] Current line:  {line}\n"
+                    f"[{i + 1:d}] Next line:     {nxt}\n"
+                ) from e
+            prev = line
     df = DataFrame(objs).infer_objects().convert_dtypes()
     return df
 
 
+@MEMOIZER.cache
+def _load_datafile_cached(path: str, mtime: float, size: int) -> Optional[DataFrame]:
+    # mtime/size are key-only arguments: editing the file invalidates the
+    # cache entry without any content hashing
+    return _read_datafile(Path(path))
+
+
 def _load_datafile(path: Optional[Path]) -> Optional[DataFrame]:
     if path is None:
         return None
+    st = path.stat()
+    return _load_datafile_cached(str(path), st.st_mtime, st.st_size)
+
 
+def _read_datafile(path: Path) -> Optional[DataFrame]:
     if path.suffix == ".parquet":
         return pd.read_parquet(path)
     if path.suffix == ".csv":
+        # the Arrow engine reads large CSVs multithreaded into typed columnar
+        # buffers, typically multiple times faster than the default C engine
+        if _HAS_PYARROW:
+            return pd.read_csv(path, engine="pyarrow")
         return pd.read_csv(path)
 
     if path.suffix == ".jsonl":  # json-list, it seems, each line is an object
@@ -37,6 +37,7 @@ from df_analyze.legacy.src.objectives import (
     svm_classifier_objective,
 )
 from df_analyze.models.dummy import DummyClassifier, DummyRegressor
+from df_analyze.saving import to_csv_buffered
 from df_analyze.testing.datasets import TestDataset
 from numpy import ndarray
 from pandas import DataFrame, Index, Series
@@ -137,20 +138,20 @@ class HtuneResult:
         )
         return bool(ret)
 
-    def to_row(self) -> DataFrame:
+    def to_row_dict(self) -> dict[str, Union[str, float]]:
         selector = self.embed_select_model
         embed = "none" if selector is None else selector.value
-        return DataFrame(
-            {
-                "selection": self.selection,
-                "embed_selector": embed,
-                "model": self.model.shortname,
-                "params": str(jsonpickle.encode(self.params)),
-                "metric": self.metric.value,
-                "score": self.score,
-            },
-            index=[0],
-        )
+        return {
+            "selection": self.selection,
+            "embed_selector": embed,
+            "model": self.model.shortname,
+            "params": str(jsonpickle.encode(self.params)),
+            "metric": self.metric.value,
+            "score": self.score,
+        }
+
+    def to_row(self) -> DataFrame:
+        return DataFrame(self.to_row_dict(), index=[0])
 
     @staticmethod
     def random(
@@ -235,7 +236,7 @@ class EvaluationResults:
         features = prep.X.columns.to_list()
 
         results = []
-        dfs = []
+        rows = []
         for selection in selected:
             for model_cls in models_clses:
                 p = prep.X.shape[1]
@@ -248,10 +249,9 @@ class EvaluationResults:
                     selected_cols=selected_cols,
                     model_cls=model_cls,
                 )
-                df = result.to_row()
                 results.append(result)
-                dfs.append(df)
-        df = pd.concat(dfs, axis=0, ignore_index=True)
+                rows.append(result.to_row_dict())
+        df = DataFrame(rows)
 
         return EvaluationResults(
             df=df,
@@ -264,11 +264,9 @@ class EvaluationResults:
         )
 
     def hp_table(self) -> DataFrame:
-        dfs = []
-        for res in self.results:
-            dfs.append(res.to_row())
-        df = pd.concat(dfs, axis=0, ignore_index=True)
-        return df
+        # rows share a schema, so one DataFrame from dicts avoids allocating
+        # a one-row frame per result plus the concat copy
+        return DataFrame([res.to_row_dict() for res in self.results])
 
     def wide_table(
         self, valset: Literal["5-fold", "trainset", "holdout"] = "5-fold"
@@ -313,11 +311,14 @@ class EvaluationResults:
         return str(jsonpickle.encode(self))
 
     def save(self, root: Path) -> None:
-        self.df.to_csv(root / "performance_long_table.csv", index=False)
-        self.X_train.to_csv(root / "X_train.csv", index=False)
-        self.X_test.to_csv(root / "X_test.csv", index=False)
-        self.y_train.to_frame().to_csv(root / "y_train.csv", index=True)
-        self.y_test.to_frame().to_csv(root / "y_test.csv", index=True)
+        # the long table stays CSV since it is small and meant for eyeballing;
+        # the data splits are written as Parquet, which is binary columnar IO
+        # (no per-cell stringification) and preserves dtypes exactly
+        to_csv_buffered(self.df, root / "performance_long_table.csv", index=False)
+        self.X_train.to_parquet(root / "X_train.parquet")
+        self.X_test.to_parquet(root / "X_test.parquet")
+        self.y_train.to_frame().to_parquet(root / "y_train.parquet")
+        self.y_test.to_frame().to_parquet(root / "y_test.parquet")
         remain = {
             "results": self.results,
             "is_classification": self.is_classification,
@@ -328,10 +329,10 @@ class EvaluationResults:
     @classmethod
     def load(cls, root: Path) -> EvaluationResults:
         df = pd.read_csv(root / "performance_long_table.csv")
-        X_train = pd.read_csv(root / "X_train.csv", engine="python")
-        X_test = pd.read_csv(root / "X_test.csv", engine="python")
-        df_y_tr = pd.read_csv(root / "y_train.csv", index_col=0)
-        df_y_test = pd.read_csv(root / "y_test.csv", index_col=0)
+        X_train = pd.read_parquet(root / "X_train.parquet")
+        X_test = pd.read_parquet(root / "X_test.parquet")
+        df_y_tr = pd.read_parquet(root / "y_train.parquet")
+        df_y_test = pd.read_parquet(root / "y_test.parquet")
 
         y_train = Series(data=df_y_tr.values.ravel(), name=df_y_tr.columns.to_list()[0])
         y_test = Series(
@@ -426,23 +427,34 @@ def evaluate_tuned(
     else:
         metric = options.htune_reg_metric
 
+    # The feature subsets depend only on the selection, not the model, so
+    # resolve and validate each (X_train, X_test) pair once here instead of
+    # once per (model, selection) combination in the loop below. Note each
+    # combination is already parallelized internally (`htune_optuna` runs
+    # Optuna with `n_jobs=-1`), so the outer loop must remain serial to avoid
+    # oversubscribing cores.
+    splits: dict[str, tuple[DataFrame, DataFrame]] = {}
+    for selection, cols in selections.items():
+        selected_cols = _get_cols(selection=selection, selected=cols)
+        X_train, X_test = _get_splits(prep_train, prep_test, selection, selected_cols)
+        if X_train.empty or X_test.empty:
+            raise ValueError(
+                f"Error when subsetting features for selection '{selection}'. Got:\n"
+                f"cols: {cols}\n"
+                f"selected_cols: {selected_cols}\n"
+            )
+        if X_train.isna().any().any() or X_test.isna().any().any():
+            raise ValueError(
+                f"Got NaNs when subsetting features for selection '{selection}'. Got:\n"
+                f"cols: {cols}\n"
+                f"selected_cols: {selected_cols}\n"
+            )
+        splits[selection] = (X_train, X_test)
+
     dfs, results = [], []
     for model_cls in options.models:
         for selection, cols in selections.items():
-            selected_cols = _get_cols(selection=selection, selected=cols)
-            X_train, X_test = _get_splits(prep_train, prep_test, selection, selected_cols)
-            if X_train.empty or X_test.empty:
-                raise ValueError(
-                    f"Error when subsetting features for model '{model_cls.shortname}'. Got:\n"
-                    f"cols: {cols}\n"
-                    f"selected_cols: {selected_cols}\n"
-                )
-            if X_train.isna().any().any() or X_test.isna().any().any():
-                raise ValueError(
-                    f"Got NaNs when subsetting features for model '{model_cls.shortname}'. Got:\n"
-                    f"cols: {cols}\n"
-                    f"selected_cols: {selected_cols}\n"
-                )
+            X_train, X_test = splits[selection]
 
             if model_cls is MLPEstimator:
                 model = model_cls(num_classes=prepared.num_classes)  # type: ignore
@@ -530,7 +542,7 @@ def evaluate_tuned(
     )
 
 
-@dataclass(init=True, repr=True, eq=True, frozen=True)
+@dataclass(init=True, repr=True, eq=True, frozen=True, slots=True)
 class HtuneResultLegacy:
     estimator: Estimator
     mode: EstimationMode
@@ -42,7 +42,8 @@ from optuna import Study, Trial, create_study
 from optuna.logging import _get_library_root_logger
 from optuna.pruners import MedianPruner
 from optuna.samplers import GridSampler, TPESampler
-from optuna.trial import FrozenTrial
+from optuna.study import MaxTrialsCallback
+from optuna.trial import FrozenTrial, TrialState
 from pandas import DataFrame, Series
 from sklearn.calibration import CalibratedClassifierCV as CVCalibrate
 from sklearn.metrics import accuracy_score as acc
@@ -55,6 +56,8 @@ OPT_LOGGER = _get_library_root_logger()
 
 
 class EarlyStopping:
+    __slots__ = ("patience", "min_trials", "has_stopped")
+
     def __init__(self, patience: int = 10, min_trials: int = 50) -> None:
         self.patience: int = patience
         self.min_trials: int = min_trials
@@ -178,15 +181,28 @@ class DfAnalyzeModel(ABC):
         direction = "maximize" if metric.higher_is_better() else "minimize"
         study = create_study(
             direction=direction,
-            sampler=GridSampler(grid) if grid is not None else TPESampler(),
+            # multivariate + group TPE models joint (and conditional) hparam
+            # interactions, so fewer trials are wasted in bad regions
+            sampler=GridSampler(grid)
+            if grid is not None
+            else TPESampler(multivariate=True, group=True),
             pruner=MedianPruner(n_warmup_steps=0, n_min_trials=5),
         )
         optuna.logging.set_verbosity(verbosity)
         objective = self.optuna_objective(X_train=X_train, y_train=y_train, metric=metric)
-        cbs = [EarlyStopping(patience=15, min_trials=50)]
+        # the budget counts completed trials only: optimize() is left
+        # unbounded and MaxTrialsCallback stops the study after `n_trials`
+        # COMPLETE trials, so pruned/failed trials do not eat into `n_trials`.
+        # `timeout` and EarlyStopping (which count every started trial)
+        # backstop a study that keeps pruning. Grid search keeps the plain
+        # bound since its trials are never pruned.
+        cbs = [
+            EarlyStopping(patience=15, min_trials=50),
+            MaxTrialsCallback(n_trials, states=(TrialState.COMPLETE,)),
+        ]
         study.optimize(
             objective,
-            n_trials=n_trials,
+            n_trials=n_trials if grid is not None else None,
             callbacks=cbs if grid is None else [],
             timeout=self.__class__.timeout_s,
             n_jobs=n_jobs,
@@ -266,7 +266,7 @@ def drop_target_nans(
     target: str,
 ) -> tuple[DataFrame, int]:
     y_str = df[target].copy(deep=True)
-    y_str = y_str.apply(lambda x: np.nan if x in NAN_STRINGS else x)
+    y_str = y_str.where(~y_str.isin(NAN_STRINGS))
 
     idx = ~y_str.isna()
     df = df.loc[idx]
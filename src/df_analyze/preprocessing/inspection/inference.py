@@ -465,9 +465,8 @@ def converts_to_float(series: Series) -> bool:
 
 def infer_binary(series: Series) -> Inference:
     """To be run AFTER infer_constant, infer_timelike, infer_id"""
-    unqs = (
-        series.astype(str).apply(lambda x: np.nan if x in NAN_STRINGS else x).unique()
-    )
+    strs = series.astype(str)
+    unqs = strs.where(~strs.isin(NAN_STRINGS)).unique()
     try:
         str_nan = "nan" in map(str.lower, unqs.astype(str))
     except Exception:
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 import os
+import pickle
+import re
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from hashlib import md5
 from pathlib import Path
 from platform import system
@@ -16,6 +20,9 @@ from typing import (
 )
 from warnings import warn
 
+import pandas as pd
+from pandas import DataFrame
+
 if TYPE_CHECKING:
     from df_analyze.analysis.univariate.associate import AssocResults
     from df_analyze.analysis.univariate.predict.predict import PredResults
@@ -28,14 +35,91 @@ if TYPE_CHECKING:
 from df_analyze.utils import Debug
 
 JOBLIB = "__JOBLIB_CACHE__"
+LEGACY_ENV = "DF_ANALYZE_LEGACY_FORMATS"
+# rows per chunk for CSV output: keeps stringification memory flat instead of
+# materializing the whole file as one Python buffer
+CSV_CHUNKSIZE = 65_536
+
+
+def _write_legacy_tables() -> bool:
+    """CSV copies of tables already saved as Parquet are opt-in: CSV is by far
+    the slowest and largest pandas output format, and the Markdown reports
+    cover the human-readable use."""
+    return os.environ.get(LEGACY_ENV, "") not in ("", "0")
+
+
+def to_csv_buffered(df: DataFrame, path: Path, **kwargs: Any) -> None:
+    """Write CSV through a 1 MiB buffer instead of open()'s default 8 KiB:
+    large tables then need orders of magnitude fewer write syscalls, which
+    matters most on network filesystems."""
+    with open(path, "w", newline="", encoding="utf-8", buffering=1 << 20) as handle:
+        df.to_csv(handle, chunksize=CSV_CHUNKSIZE, **kwargs)
+
+
+def _flat_index(df: DataFrame) -> DataFrame:
+    """pandas serializes MultiIndex frames via a drastically slower path than
+    flat ones; reset defensively before text output (no-op copy otherwise
+    avoided for the common flat case)."""
+    return df.reset_index() if isinstance(df.index, pd.MultiIndex) else df
+
+# constructing a hasher allocates a fresh (OpenSSL EVP, for md5) context each
+# time; copying an empty template is much cheaper on short payloads. The
+# template must never be update()d.
+try:  # hashes here are cache keys, not security: prefer the much faster xxhash
+    from xxhash import xxh3_64
+
+    _HASHER_TEMPLATE = xxh3_64()
+except ImportError:
+    try:
+        # non-security use lets OpenSSL skip FIPS-compliance overhead
+        _HASHER_TEMPLATE = md5(usedforsecurity=False)
+    except TypeError:  # interpreter/OpenSSL without the flag
+        _HASHER_TEMPLATE = md5()
+
+
+def _new_hasher() -> Any:
+    return _HASHER_TEMPLATE.copy()
+
 
+# types whose repr is deterministic across processes (no default object repr
+# with memory addresses): cheap to encode directly without pickling
+_STABLE_REPR = (str, int, float, bool, bytes, type(None), Path, Enum)
 
-class FileType(Enum):
-    Interim = "interim"
-    Final = "final"
-    Feature = "feature"
-    Params = "params"
-    Univariate = "univariate"
+# characters allowed in a formatted (un-hashed) get_hash key: these keys name
+# directories, so anything outside this set (separators, control characters,
+# quotes introduced by repr-escaping) forces the hashing path instead
+_FAST_KEY_CHARS = re.compile(r"[A-Za-z0-9_.='\-]+")
+
+
+def _value_bytes(value: Any) -> bytes:
+    if isinstance(value, _STABLE_REPR):
+        return repr(value).encode()
+    return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _try_dir(path: Path) -> bool:
+    """Attempt to create (or reuse) `path` and report whether it is usable.
+    try/except around mkdir replaces the old check-then-create os.access
+    probes, which cost extra syscalls and can lie on NFS and in containers;
+    one access() check remains for the pre-existing-directory case."""
+    try:
+        path.mkdir(exist_ok=True, parents=True)
+    except OSError:
+        return False
+    return os.access(path, os.W_OK)
+
+
+_CREATED_DIRS: set[Path] = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    """mkdir only when needed: paths already created this process skip even
+    the isdir stat, and existing dirs skip the mkdir EEXIST round-trip."""
+    if path in _CREATED_DIRS:
+        return
+    if not os.path.isdir(path):
+        path.mkdir(exist_ok=True, parents=True)
+    _CREATED_DIRS.add(path)
 
 
 @dataclass
@@ -61,7 +145,10 @@ class ProgramDirs(Debug):
     needs_clean: bool = False
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def new(root: Optional[Path], hsh: str) -> ProgramDirs:
+        # cached: rebuilding options in one process re-derives the same dirs,
+        # and the directory tree only needs creating once
         root, needs_clean = ProgramDirs.configure_root(root)
 
         if root is None:
@@ -87,6 +174,7 @@ class ProgramDirs(Debug):
             results=root / "results",
             needs_clean=needs_clean,
         )
+        targets = []
         for attr, path in new.__dict__.items():
             if isinstance(path, Path):
                 if "JOBLIB" in str(path):  # joblib handles creation
@@ -94,72 +182,74 @@ class ProgramDirs(Debug):
                 if attr in ["options", "renames"]:
                     continue
                 if attr == "terminal":
-                    path.touch()
                     continue
-                try:
-                    path.mkdir(exist_ok=True, parents=True)
-                except Exception:
-                    warn(
-                        "Got error creating output directories:\n"
-                        f"{traceback.format_exc()}.\n"
-                        "Defaulting to in-memory results."
-                    )
-                    return ProgramDirs(root=None)
+                targets.append(path)
+        # mkdir(parents=True) creates all ancestors, so only the deepest
+        # paths need explicit syscalls: e.g. creating `features/associations`
+        # also creates `features` and the root
+        leaves = [p for p in targets if not any(p in q.parents for q in targets)]
+        try:
+            for path in leaves:
+                _ensure_dir(path)
+            if new.terminal is not None:
+                new.terminal.touch()
+        except Exception:
+            warn(
+                "Got error creating output directories:\n"
+                f"{traceback.format_exc()}.\n"
+                "Defaulting to in-memory results."
+            )
+            return ProgramDirs(root=None)
         return new
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def configure_root(root: Optional[Path] = None) -> tuple[Optional[Path], bool]:
+        # cached: repeat calls would re-run several access/stat/mkdir
+        # syscalls (and could create multiple tempdir fallbacks)
         try:
-            if (root is not None) and (not os.access(root, os.W_OK)):
-                raise PermissionError(
-                    f"Provided outdir: {root} is not writeable. Provide a "
-                    "different directory or pass `None` to allow `df-analyze` "
-                    "to configure this automatically."
-                )
-
             needs_clean = False
             outdir = root or Path.home().resolve() / "df-analyze-outputs"
             if system().lower() == "windows":
                 return outdir, needs_clean
 
-            if not os.access(outdir, os.W_OK):
-                new = Path.cwd().resolve() / "df-analyze-outputs"
-                warn(f"Do not have write permissions for {outdir}. Trying: {new}.")
-                outdir = new
-            else:
-                outdir.mkdir(exist_ok=True, parents=True)
+            if _try_dir(outdir):
                 return outdir, needs_clean
+            if root is not None:
+                raise PermissionError(
+                    f"Provided outdir: {root} is not writeable. Provide a "
+                    "different directory or pass `None` to allow `df-analyze` "
+                    "to configure this automatically."
+                )
 
-            if not os.access(outdir, os.W_OK):
-                try:
-                    raw = mkdtemp(prefix="df_analyze_tmp")
-                    needs_clean = True
-                    new = Path(raw)
-                    warn(
-                        f"Did not have write permissions for {outdir}. Created a "
-                        f"temporary directory at {new} instead."
-                    )
-                    outdir = new
-                    outdir.mkdir(exist_ok=True, parents=True)
-                    return outdir, needs_clean
-                except FileExistsError:
-                    warn(
-                        f"Found existing temporary data. Likely this exists "
-                        f"at {Path(gettempprefix()).resolve()} and must be "
-                        "deleted. Holding results in memory instead. "
-                    )
-                    return None, needs_clean
-                except Exception as e:
-                    warn(
-                        "Could not create temporary directory. Falling back to "
-                        f"storing results in memory. Error details:\n{e}"
-                        f"{traceback.format_exc()}"
-                    )
-                    return None, needs_clean
-
-            else:
-                outdir.mkdir(exist_ok=True, parents=True)
-                return outdir, needs_clean
+            new = Path.cwd().resolve() / "df-analyze-outputs"
+            warn(f"Do not have write permissions for {outdir}. Trying: {new}.")
+            if _try_dir(new):
+                return new, needs_clean
+
+            try:
+                raw = mkdtemp(prefix="df_analyze_tmp")
+                needs_clean = True
+                new = Path(raw)
+                warn(
+                    f"Did not have write permissions for {outdir}. Created a "
+                    f"temporary directory at {new} instead."
+                )
+                return new, needs_clean
+            except FileExistsError:
+                warn(
+                    f"Found existing temporary data. Likely this exists "
+                    f"at {Path(gettempprefix()).resolve()} and must be "
+                    "deleted. Holding results in memory instead. "
+                )
+                return None, needs_clean
+            except Exception as e:
+                warn(
+                    "Could not create temporary directory. Falling back to "
+                    f"storing results in memory. Error details:\n{e}"
+                    f"{traceback.format_exc()}"
+                )
+                return None, needs_clean
         except Exception as e:
             warn(
                 "Could not create temporary directory. Falling back to "
@@ -206,8 +296,15 @@ class ProgramDirs(Debug):
         tuned = self.tuning / "tuned_models.csv"
         df_tuned = results.hp_table()
         try:
-            results.df.to_csv(perfs)
-            df_tuned.to_csv(tuned)
+            # independent files: pandas releases the GIL in its C writer, so
+            # the two serializations overlap instead of running back-to-back
+            with ThreadPoolExecutor(max_workers=2) as ex:
+                futs = [
+                    ex.submit(to_csv_buffered, _flat_index(results.df), perfs),
+                    ex.submit(to_csv_buffered, _flat_index(df_tuned), tuned),
+                ]
+                for fut in futs:
+                    fut.result()
         except Exception as e:
             warn(
                 "Got exception when attempting to save final evaluation report. "
@@ -359,6 +456,8 @@ class ProgramDirs(Debug):
                 "Got exception when attempting to save raw predictions. "
                 f"Details:\n{e}\n{traceback.format_exc()}"
             )
+        if not _write_legacy_tables():  # same data as the raw Parquet saves
+            return
         try:
             preds.save_tables(self.predictions)
         except Exception as e:
@@ -377,6 +476,8 @@ class ProgramDirs(Debug):
                 "Got exception when attempting to save raw associations. "
                 f"Details:\n{e}\n{traceback.format_exc()}"
             )
+        if not _write_legacy_tables():  # same data as the raw Parquet saves
+            return
         try:
             assocs.save_tables(self.associations)
         except Exception as e:
@@ -432,7 +533,7 @@ class ProgramDirs(Debug):
         try:
             df = inspection.basic_df()
             out = self.inspection / "inferred_types.csv"
-            df.to_csv(out)
+            to_csv_buffered(_flat_index(df), out)
         except Exception as e:
             warn(
                 "Got exception when attempting to save inspection table(s). "
@@ -452,14 +553,44 @@ class ProgramDirs(Debug):
 
 
 def get_hash(args: dict[str, Any], ignores: Optional[list[str]] = None) -> str:
-    ignores = [] if ignores is None else ignores
-    to_hash = {**args}
-    for ignore in ignores:
-        if ignore in to_hash:
-            to_hash.pop(ignore)
+    # no copy when there is nothing to drop; otherwise filter in one pass
+    # rather than copy-then-pop per ignored key
+    if not ignores:
+        to_hash = args
+    else:
+        ignore_set = set(ignores)
+        to_hash = {k: v for k, v in args.items() if k not in ignore_set}
+
+    # tiny all-scalar dicts don't need hashing at all: a readable formatted
+    # key is cheaper to build and nicer to see in cache/output dir names.
+    # Values are repr'd so that e.g. None and "None" stay distinct. The
+    # formatted key is used only when it is unambiguous and filesystem-safe:
+    # keys must be identifiers (so the "=" and "-" record separators cannot
+    # be forged) and the whole key must pass a strict character whitelist;
+    # anything else — including long keys, where truncating would let shared
+    # prefixes collide — falls through to the hashing path.
+    if (
+        len(to_hash) <= 3
+        and all(isinstance(k, str) and k.isidentifier() for k in to_hash)
+        and all(
+            isinstance(v, (str, int, bool, type(None))) for v in to_hash.values()
+        )
+    ):
+        key = "-".join(f"{k}={v!r}" for k, v in sorted(to_hash.items()))
+        if len(key) <= 64 and _FAST_KEY_CHARS.fullmatch(key) is not None:
+            return key
 
     # quick and dirty hashing for caching  https://stackoverflow.com/a/1151705
     # we are not really worried about collisions with the tiny amount of
-    # comparisons / different combinations we have here
-    hsh = md5(str(tuple(sorted(to_hash.items()))).encode()).hexdigest()
-    return hsh
+    # comparisons / different combinations we have here. Keys and values are
+    # joined with separators into a single bytearray (no tuple, no giant
+    # repr string); values with stable reprs skip pickling entirely.
+    buf = bytearray()
+    for key in sorted(to_hash):
+        buf += key.encode()
+        buf += b"\x00"
+        buf += _value_bytes(to_hash[key])
+        buf += b"\x01"
+    hasher = _new_hasher()
+    hasher.update(buf)
+    return hasher.hexdigest()